@@ -6,10 +6,20 @@ from email.mime.text import MIMEText
 from email.header import Header
 import time
 import queue
-from threading import Thread
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from io import StringIO
+from threading import Lock, Thread
 import re
 
+try:
+    import aiosmtplib
+except ImportError:
+    # Optional: enables the single-threaded asyncio send backend. Without it
+    # the app falls back to the thread-pool backend.
+    aiosmtplib = None
+
 # --- 0. Initial Setup ---
 
 # Streamlit page configuration
@@ -51,13 +61,20 @@ def initialize_session_state():
         # -----------------------------------
         'workers': 3,
         'retries': 3,
-        'job_queue': queue.Queue(),
         'email_list_input': "",
         'column_mapping': {},
+        'compiled_template': None,
         'last_csv_name': None,
         'html_uploader_name': None,
         'html_uploader': None,
-        'threads': [],
+        'executor': None,
+        'smtp_pool': None,
+        'futures': [],
+        'submitted_count': 0,
+        'status_queue': queue.Queue(),
+        # One-element list so send tasks can mutate the count in place.
+        'completed_counter': [0],
+        'send_lock': Lock(),
     }
 
     for key, value in defaults.items():
@@ -83,133 +100,509 @@ def go_prev():
 
 # --- 3. Core Logic Functions ---
 
+# Basic RFC-like check (not exhaustive) that covers common valid addresses;
+# compiled once and shared with the vectorized prefilter in start_sending.
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+@lru_cache(maxsize=100_000)
 def is_valid_email(email):
-    """Lightweight email validation using regex to avoid external dependencies."""
+    """
+    Lightweight email validation using regex to avoid external dependencies.
+    Results are cached since lists commonly repeat addresses across rows.
+    """
     if not isinstance(email, str) or not email:
         return False
-    email = email.strip()
-    # Basic RFC-like check (not exhaustive) that covers common valid addresses
-    pattern = r"^[^@\s]+@[^@\s]+\.[^@\s]+$"
-    return re.fullmatch(pattern, email) is not None
+    return EMAIL_RE.fullmatch(email.strip()) is not None
+
+STATUS_COLOR_MAP = {
+    'Sent': 'lightgreen',
+    'Failed': '#ffcccb',
+    'Authentication Error': '#ffcccb',
+    'Invalid Email': 'orange',
+    'Queued': 'lightblue',
+}
 
 def get_colored_dataframe(df):
-    """Apply conditional coloring to the Status column."""
+    """Apply conditional coloring to the Status column with one vectorized map."""
     if df is None:
         return pd.DataFrame()
 
-    def color_status(val):
-        color = ''
-        if val == 'Sent':
-            color = 'lightgreen'
-        elif val in ['Failed', 'Authentication Error']:
-            color = '#ffcccb'
-        elif val == 'Invalid Email':
-            color = 'orange'
-        elif val == 'Queued':
-            color = 'lightblue'
-        return f'background-color: {color}'
+    def color_status_column(col):
+        return 'background-color: ' + col.astype(object).map(STATUS_COLOR_MAP).fillna('')
 
     try:
-        return df.style.applymap(color_status, subset=['Status'])
+        return df.style.apply(color_status_column, subset=['Status'])
     except Exception:
         # Fallback if styling fails for any reason
         return df
 
+# Every value the Status column can take; stored as a pandas Categorical so
+# the column costs one byte per row and status comparisons stay cheap.
+STATUS_CATEGORIES = ['Pending', 'Queued', 'Sent', 'Failed', 'Invalid Email', 'Authentication Error']
+
 def update_status(index, status):
-    """Safely update the status of a specific record in session state."""
-    if st.session_state.df is not None:
+    """
+    Records a status change for a record. Writes are buffered on a queue and
+    drained in batches by the UI thread, keeping per-row df.loc assignments
+    out of the per-email hot path.
+    """
+    st.session_state.status_queue.put((index, status))
+
+def drain_status_updates():
+    """Applies all buffered status changes to the DataFrame in one vectorized write."""
+    pairs = []
+    while True:
+        try:
+            pairs.append(st.session_state.status_queue.get_nowait())
+        except queue.Empty:
+            break
+
+    if pairs and st.session_state.df is not None:
+        indices, statuses = zip(*pairs)
         try:
-            st.session_state.df.loc[index, 'Status'] = status
+            st.session_state.df.loc[list(indices), 'Status'] = list(statuses)
         except Exception:
             # ignore any error updating status (index may not exist in df view)
             pass
 
+# Matches {{Placeholder}} tokens; the name may contain spaces (e.g. the
+# recipient column fallback uses the raw CSV column name).
+PLACEHOLDER_RE = re.compile(r"\{\{([^{}]+)\}\}")
+
+def _compile_part(text, slot_for_placeholder):
+    """
+    Splits one template string into static chunks and the CSV columns whose
+    values get interleaved between them. Unknown placeholders are left in the
+    static text untouched (matching the old str.replace behaviour).
+    """
+    statics = []
+    slots = []
+    last = 0
+    for match in PLACEHOLDER_RE.finditer(text):
+        csv_column = slot_for_placeholder.get(match.group(1))
+        if csv_column is None:
+            continue
+        statics.append(text[last:match.start()])
+        slots.append(csv_column)
+        last = match.end()
+    statics.append(text[last:])
+    return statics, slots
+
+def _codegen_render(statics, slot_idx):
+    """
+    Generates a template-specific render function with the static chunks
+    inlined as string constants, e.g.
+
+        def _render(values): return 'Hi ' + values[0] + ', ...' + values[1]
+
+    A flat concatenation of constants runs faster in CPython than any
+    generic interleave loop. `values` is the per-record value tuple.
+    """
+    if not slot_idx:
+        static = statics[0]
+        return lambda values: static
+
+    parts = []
+    for static, idx in zip(statics, slot_idx):
+        if static:
+            parts.append(repr(static))
+        parts.append(f"values[{idx}]")
+    if statics[-1]:
+        parts.append(repr(statics[-1]))
+
+    src = "def _render(values):\n    return " + " + ".join(parts)
+    namespace = {}
+    exec(src, namespace)
+    return namespace['_render']
+
+def compile_template(html_template, subject_line, mapping, recipient_col_name):
+    """
+    Compiles the HTML body and subject line once into generated render
+    functions, so each record is rendered by a single flat concatenation
+    instead of running str.replace per placeholder per record.
+
+    Returns (render_html, render_subject, slot_cols): slot_cols is the
+    ordered list of CSV columns a record value tuple must carry, and both
+    render functions take that tuple.
+    """
+    slot_for_placeholder = dict(mapping)
+    if recipient_col_name:
+        slot_for_placeholder.setdefault(recipient_col_name, recipient_col_name)
+
+    html_statics, html_slots = _compile_part(html_template or "", slot_for_placeholder)
+    subj_statics, subj_slots = _compile_part(subject_line or "", slot_for_placeholder)
+
+    slot_cols = list(dict.fromkeys(html_slots + subj_slots))
+    slot_index = {col: i for i, col in enumerate(slot_cols)}
+    render_html = _codegen_render(html_statics, [slot_index[col] for col in html_slots])
+    render_subject = _codegen_render(subj_statics, [slot_index[col] for col in subj_slots])
+    return render_html, render_subject, slot_cols
+
 def apply_personalization(html_template, subject_line, record, mapping, recipient_col_name):
-    """Applies the personalized data to the template and subject using the defined mapping."""
-    customized_html = html_template or ""
-    customized_subject = subject_line or ""
-
-    # 1. Apply Mapped Placeholders
-    for placeholder_name, csv_column in mapping.items():
-        placeholder = "{{" + placeholder_name + "}}"
-        value = record.get(csv_column, "")
-        str_value = str(value) if pd.notna(value) else ""
-        customized_html = customized_html.replace(placeholder, str_value)
-        customized_subject = customized_subject.replace(placeholder, str_value)
-
-    # 2. Also ensure the recipient column can be used as a fallback placeholder
+    """
+    Applies the personalized data to the template and subject using the
+    defined mapping, substituting every placeholder in one regex pass rather
+    than a full str.replace scan per mapping entry. Unknown placeholders are
+    left untouched. Used by the one-record preview; bulk sends render through
+    the compiled template instead.
+    """
+    values = {placeholder: record.get(csv_column, "") for placeholder, csv_column in mapping.items()}
+    # The recipient column doubles as a fallback placeholder
     if recipient_col_name in record:
-        recipient_placeholder = "{{" + recipient_col_name + "}}"
-        recipient_value = record.get(recipient_col_name, "")
-        str_recipient_value = str(recipient_value) if pd.notna(recipient_value) else ""
-        customized_html = customized_html.replace(recipient_placeholder, str_recipient_value)
-        customized_subject = customized_subject.replace(recipient_placeholder, str_recipient_value)
+        values.setdefault(recipient_col_name, record.get(recipient_col_name, ""))
+
+    def substitute(match):
+        value = values.get(match.group(1))
+        if value is None:
+            return match.group(0)
+        return str(value) if pd.notna(value) else ""
 
+    customized_html = PLACEHOLDER_RE.sub(substitute, html_template or "")
+    customized_subject = PLACEHOLDER_RE.sub(substitute, subject_line or "")
     return customized_html, customized_subject
 
 
-def send_email_worker(q, app_state):
-    """Worker function to send emails from a queue with retries."""
+# Recycle a worker's SMTP connection after this many sends so we reconnect
+# before the server drops us for a long-lived session.
+MAX_USES_PER_CONN = 100
+
+def open_smtp_connection(app_state):
+    """Opens, secures and authenticates a fresh SMTP connection."""
+    server = smtplib.SMTP(app_state['smtp_server'], int(app_state['smtp_port']))
+    server.starttls()
+    server.login(app_state['sender_email'], app_state['sender_password'])
+    return server
+
+def close_smtp_connection(server):
+    """Quietly closes an SMTP connection, ignoring errors on an already-dead socket."""
+    if server is not None:
+        try:
+            server.quit()
+        except Exception:
+            pass
+
+class SMTPPool:
+    """
+    A fixed-size pool of authenticated SMTP connections shared by the send
+    tasks. Connections are dialed lazily on first get(); callers return a
+    healthy connection with put() and drop a broken one with discard(), which
+    frees the slot for a fresh dial. Each connection is recycled after
+    MAX_USES_PER_CONN sends.
+    """
+
+    def __init__(self, app_state, size):
+        self._app_state = app_state
+        self._slots = queue.Queue()
+        for _ in range(max(1, int(size))):
+            self._slots.put(None)
+
+    def get(self):
+        """Borrows a live connection, dialing a new one if the slot is empty or stale."""
+        server = self._slots.get()
+        if server is None or getattr(server, 'pool_uses', 0) >= MAX_USES_PER_CONN:
+            close_smtp_connection(server)
+            try:
+                server = open_smtp_connection(self._app_state)
+                server.pool_uses = 0
+            except Exception:
+                self._slots.put(None)
+                raise
+        return server
+
+    def put(self, server):
+        """Returns a healthy connection to the pool."""
+        self._slots.put(server)
+
+    def discard(self, server):
+        """Drops a broken connection and frees its slot."""
+        close_smtp_connection(server)
+        self._slots.put(None)
+
+    def close(self):
+        """Closes every pooled connection."""
+        while True:
+            try:
+                close_smtp_connection(self._slots.get_nowait())
+            except queue.Empty:
+                break
+
+
+@lru_cache(maxsize=1024)
+def build_message_string(subject, html, from_header):
+    """
+    Serializes the MIME message for a (subject, html, from) triple, leaving
+    out the To: header so the result is recipient-independent. Cached because
+    low-cardinality personalization (or a placeholder-free template) produces
+    the same body over and over; senders prepend the To: line per recipient.
+    """
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = Header(subject, 'utf-8')
+    msg["From"] = Header(from_header, 'utf-8')
+    msg.attach(MIMEText(html, "html", 'utf-8'))
+    return msg.as_string()
+
+
+def finish_record(record_index, status, app_state):
+    """Records a terminal status and bumps the job's completed counter."""
+    update_status(record_index, status)
+    with app_state['send_lock']:
+        app_state['completed_counter'][0] += 1
+
+
+def send_one(record_index, recipient_email, values, pool, app_state):
+    """Renders and sends a single email using a pooled SMTP connection, with retries."""
+    if isinstance(recipient_email, str):
+        recipient_email = recipient_email.strip()
+
+    if not is_valid_email(recipient_email):
+        finish_record(record_index, "Invalid Email", app_state)
+        return
+
+    try:
+        render_html, render_subject, _ = app_state['compiled_template']
+        customized_html = render_html(values)
+        customized_subject = render_subject(values)
+
+        from_header = f"{app_state['from_name']} <{app_state['sender_email']}>"
+        body = build_message_string(customized_subject, customized_html, from_header)
+        # The serialized body is recipient-independent; only the To: header
+        # differs per send, so patch it in without re-encoding the MIME tree.
+        message = f"To: {recipient_email}\n{body}"
+
+        retries = int(app_state.get('retries', 0))
+        delay = 5
+
+        for attempt in range(max(1, retries)):
+            server = None
+            try:
+                server = pool.get()
+                server.sendmail(app_state['sender_email'], recipient_email, message)
+                server.pool_uses += 1
+                pool.put(server)
+                finish_record(record_index, "Sent", app_state)
+                return
+            except smtplib.SMTPAuthenticationError:
+                if server is not None:
+                    pool.discard(server)
+                finish_record(record_index, "Authentication Error", app_state)
+                return
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                # The server refused the transaction but the connection is
+                # still alive: reset it and return it to the pool, so the
+                # retry skips the TLS + AUTH handshake entirely.
+                print(f"SMTP attempt {attempt + 1} failed for {recipient_email}. Error: {e}")
+                if server is not None:
+                    try:
+                        server.rset()
+                        pool.put(server)
+                    except Exception:
+                        pool.discard(server)
+                if attempt < retries - 1:
+                    time.sleep(delay)
+                    delay *= 2
+                else:
+                    finish_record(record_index, "Failed", app_state)
+                    return
+            except Exception as e:
+                print(f"SMTP attempt {attempt + 1} failed for {recipient_email}. Error: {e}")
+                if server is not None:
+                    pool.discard(server)
+                if attempt < retries - 1:
+                    time.sleep(delay)
+                    delay *= 2
+                else:
+                    finish_record(record_index, "Failed", app_state)
+                    return
+
+    except Exception as e:
+        print(f"Critical error processing record {record_index}: {e}")
+        finish_record(record_index, "Failed", app_state)
+
+
+# Recipients per SMTP transaction when broadcasting an identical message.
+BROADCAST_CHUNK_SIZE = 50
+
+def send_broadcast_chunk(chunk, pool, app_state):
+    """
+    Sends one identical message to a chunk of recipients in a single SMTP
+    transaction (one MAIL FROM / DATA with many RCPT TO lines). Used when the
+    compiled template has no placeholders, so every rendered body is the same.
+    """
+    recipients = [
+        (record_index, email.strip() if isinstance(email, str) else email)
+        for record_index, email in chunk
+    ]
+
+    try:
+        render_html, render_subject, _ = app_state['compiled_template']
+        from_header = f"{app_state['from_name']} <{app_state['sender_email']}>"
+        body = build_message_string(render_subject(()), render_html(()), from_header)
+        # Individual recipients travel in the envelope only.
+        message = "To: undisclosed-recipients:;\n" + body
+
+        retries = int(app_state.get('retries', 0))
+        delay = 5
+
+        for attempt in range(max(1, retries)):
+            server = None
+            try:
+                server = pool.get()
+                refused = server.sendmail(
+                    app_state['sender_email'], [email for _, email in recipients], message
+                )
+                server.pool_uses += len(recipients)
+                pool.put(server)
+                for record_index, email in recipients:
+                    status = "Failed" if email in refused else "Sent"
+                    finish_record(record_index, status, app_state)
+                return
+            except smtplib.SMTPAuthenticationError:
+                if server is not None:
+                    pool.discard(server)
+                for record_index, _ in recipients:
+                    finish_record(record_index, "Authentication Error", app_state)
+                return
+            except (smtplib.SMTPRecipientsRefused, smtplib.SMTPSenderRefused, smtplib.SMTPDataError) as e:
+                print(f"SMTP attempt {attempt + 1} failed for broadcast chunk. Error: {e}")
+                if server is not None:
+                    try:
+                        server.rset()
+                        pool.put(server)
+                    except Exception:
+                        pool.discard(server)
+                if attempt < retries - 1:
+                    time.sleep(delay)
+                    delay *= 2
+                else:
+                    for record_index, _ in recipients:
+                        finish_record(record_index, "Failed", app_state)
+                    return
+            except Exception as e:
+                print(f"SMTP attempt {attempt + 1} failed for broadcast chunk. Error: {e}")
+                if server is not None:
+                    pool.discard(server)
+                if attempt < retries - 1:
+                    time.sleep(delay)
+                    delay *= 2
+                else:
+                    for record_index, _ in recipients:
+                        finish_record(record_index, "Failed", app_state)
+                    return
+
+    except Exception as e:
+        print(f"Critical error processing broadcast chunk: {e}")
+        for record_index, _ in recipients:
+            finish_record(record_index, "Failed", app_state)
+
+
+async def _async_send_worker(job_q, app_state):
+    """
+    Drains jobs from an asyncio queue over one persistent aiosmtplib
+    connection, reconnecting on error and recycling after
+    MAX_USES_PER_CONN sends (same contract as the threaded SMTPPool).
+    """
+    client = None
+    uses = 0
+
+    async def close_client():
+        if client is not None:
+            try:
+                await client.quit()
+            except Exception:
+                pass
+
     while True:
         try:
-            record_index, record = q.get(timeout=1)
-        except queue.Empty:
+            record_index, recipient_email, values = job_q.get_nowait()
+        except asyncio.QueueEmpty:
             break
 
-        recipient_email = record.get(app_state['recipient_col'], "")
         if isinstance(recipient_email, str):
             recipient_email = recipient_email.strip()
 
         if not is_valid_email(recipient_email):
-            update_status(record_index, "Invalid Email")
-            q.task_done()
+            finish_record(record_index, "Invalid Email", app_state)
             continue
 
         try:
-            customized_html, customized_subject = apply_personalization(
-                app_state['html_template'],
-                app_state['subject_line'],
-                record,
-                app_state['column_mapping'],
-                app_state['recipient_col']
-            )
+            render_html, render_subject, _ = app_state['compiled_template']
+            customized_html = render_html(values)
+            customized_subject = render_subject(values)
 
-            msg = MIMEMultipart("alternative")
-            msg["Subject"] = Header(customized_subject, 'utf-8')
-            msg["From"] = Header(f"{app_state['from_name']} <{app_state['sender_email']}>", 'utf-8')
-            msg["To"] = recipient_email
-            part1 = MIMEText(customized_html, "html", 'utf-8')
-            msg.attach(part1)
+            from_header = f"{app_state['from_name']} <{app_state['sender_email']}>"
+            body = build_message_string(customized_subject, customized_html, from_header)
+            message = f"To: {recipient_email}\n{body}"
 
             retries = int(app_state.get('retries', 0))
             delay = 5
 
             for attempt in range(max(1, retries)):
                 try:
-                    with smtplib.SMTP(app_state['smtp_server'], int(app_state['smtp_port'])) as server:
-                        server.starttls()
-                        server.login(app_state['sender_email'], app_state['sender_password'])
-                        server.sendmail(app_state['sender_email'], recipient_email, msg.as_string())
-                        update_status(record_index, "Sent")
-                        break
-                except smtplib.SMTPAuthenticationError:
-                    update_status(record_index, "Authentication Error")
+                    if client is None or not client.is_connected or uses >= MAX_USES_PER_CONN:
+                        await close_client()
+                        client = aiosmtplib.SMTP(
+                            hostname=app_state['smtp_server'],
+                            port=int(app_state['smtp_port']),
+                            start_tls=True,
+                        )
+                        await client.connect()
+                        await client.login(app_state['sender_email'], app_state['sender_password'])
+                        uses = 0
+
+                    await client.sendmail(app_state['sender_email'], recipient_email, message)
+                    uses += 1
+                    finish_record(record_index, "Sent", app_state)
+                    break
+                except aiosmtplib.SMTPAuthenticationError:
+                    finish_record(record_index, "Authentication Error", app_state)
                     break
+                except (aiosmtplib.SMTPRecipientsRefused, aiosmtplib.SMTPResponseException) as e:
+                    # Transaction refused but the connection survives: RSET
+                    # and retry on it instead of re-dialing.
+                    print(f"SMTP attempt {attempt + 1} failed for {recipient_email}. Error: {e}")
+                    if client is not None:
+                        try:
+                            await client.rset()
+                        except Exception:
+                            client = None
+                    if attempt < retries - 1:
+                        await asyncio.sleep(delay)
+                        delay *= 2
+                    else:
+                        finish_record(record_index, "Failed", app_state)
+                        break
                 except Exception as e:
                     print(f"SMTP attempt {attempt + 1} failed for {recipient_email}. Error: {e}")
+                    client = None
                     if attempt < retries - 1:
-                        time.sleep(delay)
+                        await asyncio.sleep(delay)
                         delay *= 2
                     else:
-                        update_status(record_index, "Failed")
+                        finish_record(record_index, "Failed", app_state)
                         break
 
         except Exception as e:
             print(f"Critical error processing record {record_index}: {e}")
-            update_status(record_index, "Failed")
+            finish_record(record_index, "Failed", app_state)
+
+    await close_client()
+
+
+async def _send_all_async(jobs, app_state, workers):
+    """Fans the job list out to `workers` persistent-connection coroutines."""
+    job_q = asyncio.Queue()
+    for job in jobs:
+        job_q.put_nowait(job)
+    await asyncio.gather(*(_async_send_worker(job_q, app_state) for _ in range(workers)))
+
+
+def run_async_send(jobs, app_state, workers):
+    """Entry point for the single background thread driving the asyncio backend."""
+    try:
+        asyncio.run(_send_all_async(jobs, app_state, workers))
+    except Exception as e:
+        print(f"Async send loop failed: {e}")
 
-        finally:
-            q.task_done()
 
 def test_smtp_connection():
     """Attempts to connect and log in to the configured SMTP server."""
@@ -259,7 +652,16 @@ def load_data_source(csv_file_data, email_list_text):
     if csv_file_data:
         try:
             csv_data = StringIO(csv_file_data.getvalue().decode("utf-8"))
-            df = pd.read_csv(csv_data).fillna('')
+            # Prefer the multithreaded pyarrow parser when available; fall
+            # back to the default C engine if pyarrow is not installed.
+            try:
+                df = pd.read_csv(csv_data, engine='pyarrow')
+            except (ImportError, ValueError):
+                csv_data.seek(0)
+                df = pd.read_csv(csv_data)
+            # Coerce every data column to str once at load time, so rendering
+            # never pays per-cell pd.notna()/str() calls in the send loop.
+            df = df.fillna('').astype(str)
 
             if new_csv_uploaded:
                 st.session_state.recipient_col = None
@@ -268,6 +670,7 @@ def load_data_source(csv_file_data, email_list_text):
 
             if 'Status' not in df.columns:
                 df['Status'] = 'Pending'
+            df['Status'] = pd.Categorical(df['Status'], categories=STATUS_CATEGORIES)
             df['Record ID'] = df.index
 
             st.session_state.df = df
@@ -296,7 +699,7 @@ def load_data_source(csv_file_data, email_list_text):
 
         recipient_col_name = 'Recipient Email'
         df = pd.DataFrame(valid_emails_only, columns=[recipient_col_name])
-        df['Status'] = 'Pending'
+        df['Status'] = pd.Categorical(['Pending'] * len(df), categories=STATUS_CATEGORIES)
         df['Record ID'] = df.index
 
         st.session_state.df = df
@@ -316,38 +719,118 @@ def start_sending():
         st.error("Please complete all previous steps (Data, Template, and SMTP Test) before starting the send job.")
         return
 
-    st.session_state.job_queue = queue.Queue()
     st.session_state.is_sending = True
-    st.session_state.threads = []
 
-    pending_df = df[df['Status'] != 'Sent'].copy()
+    # Compile the template once for the whole job; workers only interleave values.
+    compiled = compile_template(
+        st.session_state.html_template,
+        st.session_state.subject_line,
+        st.session_state.column_mapping,
+        st.session_state.recipient_col
+    )
+    st.session_state.compiled_template = compiled
+    slot_cols = compiled[2]
 
-    if pending_df.empty:
+    pending_mask = df['Status'] != 'Sent'
+
+    if not pending_mask.any():
         st.warning("No pending emails found.")
         st.session_state.is_sending = False
         return
 
-    for index, row in pending_df.iterrows():
-        update_status(index, "Queued")
-        st.session_state.job_queue.put((index, row.to_dict()))
+    # Validate recipients in one vectorized pass so invalid rows are marked
+    # up front and never submitted to the pool.
+    recipients = df.loc[pending_mask, st.session_state.recipient_col]
+    valid = recipients.str.strip().str.fullmatch(EMAIL_RE).fillna(False)
+    invalid_index = valid.index[~valid]
+    if len(invalid_index) > 0:
+        df.loc[invalid_index, 'Status'] = 'Invalid Email'
+        pending_mask.loc[invalid_index] = False
+
+    if not pending_mask.any():
+        st.warning("No valid pending emails found.")
+        st.session_state.is_sending = False
+        return
 
-    st.info(f"Starting {st.session_state.job_queue.qsize()} emails with {st.session_state.workers} workers...")
+    df.loc[pending_mask, 'Status'] = 'Queued'
+
+    with st.session_state.send_lock:
+        st.session_state.completed_counter[0] = 0
+
+    workers = max(1, int(st.session_state.workers))
+    if st.session_state.executor is not None:
+        st.session_state.executor.shutdown(wait=False)
+        st.session_state.executor = None
+
+    # Build compact (index, recipient, value-tuple) payloads instead of full
+    # row dicts; senders render by position against the compiled template.
+    # Each needed column is pulled once as a zero-copy numpy view rather than
+    # materializing a projected sub-DataFrame.
+    pending_index = df.index[pending_mask]
+    columns = [
+        df.loc[pending_mask, col].to_numpy(copy=False)
+        for col in [st.session_state.recipient_col] + slot_cols
+    ]
+    jobs = [
+        (idx, row[0], tuple(row[1:]))
+        for idx, row in zip(pending_index, zip(*columns))
+    ]
+    st.session_state.submitted_count = len(jobs)
+    st.session_state.futures = []
+
+    if not slot_cols:
+        # Placeholder-free template: every body is identical, so batch
+        # recipients into multi-RCPT transactions instead of one DATA each.
+        st.session_state.executor = ThreadPoolExecutor(max_workers=workers)
+        st.session_state.smtp_pool = SMTPPool(st.session_state, workers)
+        st.session_state.futures = [
+            st.session_state.executor.submit(
+                send_broadcast_chunk,
+                [(idx, email) for idx, email, _ in jobs[i:i + BROADCAST_CHUNK_SIZE]],
+                st.session_state.smtp_pool,
+                st.session_state,
+            )
+            for i in range(0, len(jobs), BROADCAST_CHUNK_SIZE)
+        ]
+    elif aiosmtplib is not None:
+        # Preferred backend: a single background thread drives an asyncio
+        # loop with `workers` persistent connections, so in-flight sends
+        # don't each occupy an OS thread.
+        Thread(target=run_async_send, args=(jobs, st.session_state, workers), daemon=True).start()
+    else:
+        st.session_state.executor = ThreadPoolExecutor(max_workers=workers)
+        st.session_state.smtp_pool = SMTPPool(st.session_state, workers)
+        st.session_state.futures = [
+            st.session_state.executor.submit(
+                send_one, idx, email, vals, st.session_state.smtp_pool, st.session_state
+            )
+            for idx, email, vals in jobs
+        ]
 
-    for i in range(max(1, int(st.session_state.workers))):
-        worker = Thread(target=send_email_worker, args=(st.session_state.job_queue, st.session_state), daemon=True)
-        worker.start()
-        st.session_state.threads.append(worker)
+    st.info(f"Starting {len(jobs)} emails with {workers} workers...")
 
 def check_sending_status():
-    """Checks the queue and updates the UI (called periodically)."""
+    """Checks the submitted futures and updates the UI (called periodically)."""
+
+    drain_status_updates()
 
     total_records = len(st.session_state.df)
-    completed_statuses = ['Sent', 'Failed', 'Invalid Email', 'Authentication Error']
-    completed_count = st.session_state.df['Status'].isin(completed_statuses).sum()
+    submitted = st.session_state.submitted_count
+    with st.session_state.send_lock:
+        done_count = st.session_state.completed_counter[0]
 
-    if (completed_count == total_records) or (st.session_state.job_queue.empty() and not any(t.is_alive() for t in st.session_state.threads)):
+    # Rows that were never submitted (e.g. already Sent) count as completed.
+    completed_count = total_records - submitted + done_count
+
+    if done_count >= submitted:
         if st.session_state.is_sending: # Only show success message if it was actively sending
             st.session_state.is_sending = False
+            if st.session_state.executor is not None:
+                st.session_state.executor.shutdown(wait=False)
+                st.session_state.executor = None
+            if st.session_state.smtp_pool is not None:
+                st.session_state.smtp_pool.close()
+                st.session_state.smtp_pool = None
             st.success("Email sending job finished!")
             st.rerun()
 
@@ -683,15 +1166,33 @@ elif st.session_state.step_index == 4:
 
             st.warning("Sending in progress. Do not refresh the page until complete.")
 
-            # Display and constantly update the dataframe via st.rerun
-            st.dataframe(get_colored_dataframe(st.session_state.df), use_container_width=True, hide_index=True)
-
-            time.sleep(1)
+            # Display and constantly update the dataframe via st.rerun. Only
+            # the head and tail are styled while sending, so per-tick render
+            # cost stays bounded on very large lists.
+            display_df = st.session_state.df
+            if len(display_df) > 100:
+                st.caption(f"Showing the first and last 50 of {len(display_df)} records while sending.")
+                display_df = pd.concat([display_df.head(50), display_df.tail(50)])
+            st.dataframe(get_colored_dataframe(display_df), use_container_width=True, hide_index=True)
+
+            # Coalesce reruns: poll the cheap completion counter and only
+            # re-render when progress actually advanced or 2 s have passed,
+            # instead of redrawing an unchanged page every second.
+            with st.session_state.send_lock:
+                done_before = st.session_state.completed_counter[0]
+            wait_started = time.time()
+            while True:
+                time.sleep(0.5)
+                with st.session_state.send_lock:
+                    done_now = st.session_state.completed_counter[0]
+                if done_now != done_before or time.time() - wait_started >= 2:
+                    break
             st.rerun()
 
         else:
             # Final Status Table
             if st.session_state.df is not None:
+                drain_status_updates()
                 st.dataframe(get_colored_dataframe(st.session_state.df), use_container_width=True, hide_index=True)
 
     else: